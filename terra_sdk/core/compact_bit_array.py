@@ -14,15 +14,15 @@ from terra_sdk.util.json import JSONSerializable
 __all__ = ["CompactBitArray"]
 
 
-@attr.s
+@attr.s(slots=True)
 class CompactBitArray(JSONSerializable):
-    extra_bits_stored: int = attr.ib(converter=int)
+    extra_bits_stored: int = attr.ib()
     elems: bytearray = attr.ib(converter=bytearray)
 
     @classmethod
     def from_data(cls, data: dict) -> CompactBitArray:
         return cls(
-            data["extra_bits_stored"], bytearray(base64.b64decode(data["elems"]))
+            int(data["extra_bits_stored"]), bytearray(base64.b64decode(data["elems"]))
         )
 
     def to_data(self) -> dict:
@@ -71,18 +71,11 @@ class CompactBitArray(JSONSerializable):
         return True
 
     def num_true_bits_before(self, index: int) -> int:
-        def count_one_bits(n: int):
-            return len("".join("{0:b}".format(n).split("0")))
-
-        ones_count = 0
-        _max = self.count()
-        if index > _max:
-            index = _max
-
-        elem = 0
-        while True:
-            if (elem * 8 + 7) >= index:
-                ones_count += count_one_bits(self.elems[elem] >> (7 - (index % 8) + 1))
-                return ones_count
-            ones_count += count_one_bits(self.elems[elem])
-            elem += 1
+        index = min(index, self.count())
+        full, rest = divmod(index, 8)
+
+        # popcount the whole bytes in one go rather than byte by byte
+        ones_count = bin(int.from_bytes(self.elems[:full], "big")).count("1")
+        if rest:
+            ones_count += bin(self.elems[full] >> (8 - rest)).count("1")
+        return ones_count
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 import attr
+import betterproto
 from terra_proto.cosmos.tx.v1beta1 import ModeInfo as ModeInfo_pb
 from terra_proto.cosmos.tx.v1beta1 import ModeInfoMulti as ModeInfoMulti_pb
 from terra_proto.cosmos.tx.v1beta1 import ModeInfoSingle as ModeInfoSingle_pb
@@ -22,7 +23,7 @@ __all__ = [
 from terra_proto.cosmos.tx.signing.v1beta1 import SignMode
 
 
-@attr.s
+@attr.s(slots=True)
 class ModeInfo(JSONSerializable):
 
     single: Optional[ModeInfoSingle] = attr.ib(default=None)
@@ -51,13 +52,16 @@ class ModeInfo(JSONSerializable):
 
     @classmethod
     def from_proto(cls, proto: ModeInfo_pb) -> ModeInfo:
-        if proto.single is not None:
-            return ModeInfo(single=ModeInfoSingle.from_proto(proto.single))
-        else:
-            return ModeInfo(multi=ModeInfoMulti.from_proto(proto.multi))
+        # unset message fields decode as empty messages, never None, so
+        # dispatch on the oneof member that was actually on the wire
+        field, value = betterproto.which_one_of(proto, "sum")
+        build = _MODE_INFO_FROM_PROTO.get(field)
+        if build is None:
+            raise ValueError("ModeInfo should have one of single or multi")
+        return build(value)
 
 
-@attr.s
+@attr.s(slots=True)
 class ModeInfoSingle(JSONSerializable):
     mode: SignMode = attr.ib()
 
@@ -77,7 +81,7 @@ class ModeInfoSingle(JSONSerializable):
         return cls(mode=mode)
 
 
-@attr.s
+@attr.s(slots=True)
 class ModeInfoMulti(JSONSerializable):
     bitarray: CompactBitArray = attr.ib()
     mode_infos: List[ModeInfo] = attr.ib()
@@ -105,5 +109,11 @@ class ModeInfoMulti(JSONSerializable):
     def from_proto(cls, proto: ModeInfoMulti_pb) -> ModeInfoMulti:
         return cls(
             CompactBitArray.from_proto(proto.bitarray),
-            ModeInfo_pb.from_proto(proto.mode_infos),
+            [ModeInfo.from_proto(mi) for mi in proto.mode_infos],
         )
+
+
+_MODE_INFO_FROM_PROTO = {
+    "single": lambda proto: ModeInfo(single=ModeInfoSingle.from_proto(proto)),
+    "multi": lambda proto: ModeInfo(multi=ModeInfoMulti.from_proto(proto)),
+}
@@ -35,7 +35,7 @@ class SignDoc(JSONSerializable):
             else None,
             "fee": auth.fee.to_amino(),
             "msgs": [msg.to_amino() for msg in tx.messages],
-            "memo": tx.memo if tx.memo else "",
+            "memo": tx.memo,
         }
 
     @classmethod
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import base64
-import json
 from typing import Dict, List, Optional
 
 import attr
@@ -28,7 +27,7 @@ from terra_sdk.core.public_key import (
     SimplePublicKey,
 )
 from terra_sdk.core.signature_v2 import SignatureV2
-from terra_sdk.util.json import JSONSerializable
+from terra_sdk.util.json import JSONSerializable, dict_to_data
 
 __all__ = [
     "SignMode",
@@ -43,18 +42,44 @@ __all__ = [
 ]
 
 # just alias
-from terra_sdk.util.parse_msg import parse_proto
+from terra_sdk.util.parse_msg import parse_proto, parse_unpack_any
 
 SignMode = SignMode_pb
+_MODE_DIRECT = SignMode.SIGN_MODE_DIRECT
 
 
-@attr.s
+@attr.s(slots=True)
 class SignerData:
-    sequence: int = attr.ib(converter=int)
+    sequence: int = attr.ib()
     public_key: Optional[PublicKey] = attr.ib(default=None)
 
 
-@attr.s
+def _empty_signer_info(signer: SignerData) -> SignerInfo:
+    if signer.public_key is None:
+        return SignerInfo(
+            public_key=SimplePublicKey(""),
+            sequence=signer.sequence,
+            mode_info=ModeInfo(ModeInfoSingle(mode=_MODE_DIRECT)),
+        )
+    if isinstance(signer.public_key, LegacyAminoMultisigPublicKey):
+        return SignerInfo(
+            public_key=signer.public_key,
+            sequence=signer.sequence,
+            mode_info=ModeInfo(
+                multi=ModeInfoMulti(
+                    CompactBitArray.from_bits(len(signer.public_key.public_keys)),
+                    [],
+                )
+            ),
+        )
+    return SignerInfo(
+        public_key=signer.public_key,
+        sequence=signer.sequence,
+        mode_info=ModeInfo(ModeInfoSingle(mode=_MODE_DIRECT)),
+    )
+
+
+@attr.s(slots=True)
 class Tx(JSONSerializable):
     """Data structure for a transaction which can be broadcasted.
 
@@ -107,37 +132,8 @@ class Tx(JSONSerializable):
         return c
 
     def append_empty_signatures(self, signers: List[SignerData]):
-        for signer in signers:
-            if signer.public_key is not None:
-                if isinstance(signer.public_key, LegacyAminoMultisigPublicKey):
-                    signer_info = SignerInfo(
-                        public_key=signer.public_key,
-                        sequence=signer.sequence,
-                        mode_info=ModeInfo(
-                            multi=ModeInfoMulti(
-                                CompactBitArray.from_bits(
-                                    len(signer.public_key.public_keys)
-                                ),
-                                [],
-                            )
-                        ),
-                    )
-                else:
-                    signer_info = SignerInfo(
-                        public_key=signer.public_key,
-                        sequence=signer.sequence,
-                        mode_info=ModeInfo(
-                            ModeInfoSingle(mode=SignMode.SIGN_MODE_DIRECT)
-                        ),
-                    )
-            else:
-                signer_info = SignerInfo(
-                    public_key=SimplePublicKey(""),
-                    sequence=signer.sequence,
-                    mode_info=ModeInfo(ModeInfoSingle(mode=SignMode.SIGN_MODE_DIRECT)),
-                )
-            self.auth_info.signer_infos.append(signer_info)
-            self.signatures.append(b" ")
+        self.auth_info.signer_infos.extend([_empty_signer_info(s) for s in signers])
+        self.signatures.extend([b" "] * len(signers))
 
     def clear_signature(self):
         self.signatures.clear()
@@ -153,7 +149,7 @@ class Tx(JSONSerializable):
             )
 
 
-@attr.s
+@attr.s(slots=True)
 class TxBody(JSONSerializable):
     """Body of a transaction.
 
@@ -164,10 +160,12 @@ class TxBody(JSONSerializable):
     """
 
     messages: List[Msg] = attr.ib()
-    memo: Optional[str] = attr.ib(default="")
-    timeout_height: int = attr.ib(
-        default=0, converter=int
-    )  # TxBody_pb.timeout_height is int
+    memo: str = attr.ib(default="")
+    timeout_height: int = attr.ib(default=0)  # TxBody_pb.timeout_height is int
+
+    def __attrs_post_init__(self):
+        self.memo = self.memo or ""
+        self.timeout_height = int(self.timeout_height or 0)
 
     def to_data(self) -> dict:
         return {
@@ -188,19 +186,19 @@ class TxBody(JSONSerializable):
         return cls(
             [Msg.from_data(m) for m in data["messages"]],
             data["memo"],
-            data["timeout_height"] if data["timeout_height"] else 0,
+            data["timeout_height"],
         )
 
     @classmethod
     def from_proto(cls, proto: TxBody_pb) -> TxBody:
         return cls(
-            [Msg.unpack_any(m) for m in proto.messages],
+            list(map(parse_unpack_any, proto.messages)),
             proto.memo,
             proto.timeout_height,
         )
 
 
-@attr.s
+@attr.s(slots=True)
 class AuthInfo(JSONSerializable):
     """AuthInfo
 
@@ -242,7 +240,7 @@ class AuthInfo(JSONSerializable):
         )
 
 
-@attr.s
+@attr.s(slots=True)
 class SignerInfo(JSONSerializable):
     """SignerInfo
     Args:
@@ -253,7 +251,7 @@ class SignerInfo(JSONSerializable):
 
     public_key: PublicKey = attr.ib()
     mode_info: ModeInfo = attr.ib()
-    sequence: int = attr.ib(converter=int)
+    sequence: int = attr.ib()
 
     def to_data(self) -> dict:
         return {
@@ -274,7 +272,7 @@ class SignerInfo(JSONSerializable):
         return cls(
             public_key=PublicKey.from_data(data["public_key"]),
             mode_info=ModeInfo.from_data(data["mode_info"]),
-            sequence=data["sequence"],
+            sequence=int(data["sequence"]),
         )
 
     @classmethod
@@ -289,21 +287,21 @@ class SignerInfo(JSONSerializable):
 def parse_events_by_type(event_data: List[dict]) -> Dict[str, Dict[str, List[str]]]:
     events: Dict[str, Dict[str, List[str]]] = {}
     for ev in event_data:
-        for att in ev["attributes"]:
-            if ev["type"] not in events:
-                events[ev["type"]] = {}
-            if att["key"] not in events[ev["type"]]:
-                events[ev["type"]][att["key"]] = []
-            events[ev["type"]][att["key"]].append(att.get("value"))
+        attributes = ev["attributes"]
+        if not attributes:
+            continue
+        bucket = events.setdefault(ev["type"], {})
+        for att in attributes:
+            bucket.setdefault(att["key"], []).append(att.get("value"))
     return events
 
 
-@attr.s
+@attr.s(slots=True)
 class TxLog(JSONSerializable):
     """Object containing the events of a transaction that is automatically generated when
     :class:`TxInfo` or :class:`BlockTxBroadcastResult` objects are read."""
 
-    msg_index: int = attr.ib(converter=int)
+    msg_index: int = attr.ib()
     """Number of the message inside the transaction that it was included in."""
 
     log: str = attr.ib()
@@ -325,66 +323,71 @@ class TxLog(JSONSerializable):
     def __attrs_post_init__(self):
         self.events_by_type = parse_events_by_type(self.events)
 
+    def to_data(self) -> dict:
+        return dict_to_data(attr.asdict(self))
+
     @classmethod
     def from_proto(cls, tx_log: AbciMessageLog_pb) -> TxLog:
-        events = [json.loads(event) for event in tx_log.events]
+        events = [event.to_dict(include_default_values=True) for event in tx_log.events]
         return cls(msg_index=tx_log.msg_index, log=tx_log.log, events=events)
 
     def to_proto(self) -> AbciMessageLog_pb:
-        str_events = []
-        for event in self.events:
-            str_events.append(json.dumps(event))
         return AbciMessageLog_pb(
-            msg_index=self.msg_index, log=self.log, events=str_events
+            msg_index=self.msg_index,
+            log=self.log,
+            events=[StringEvent_pb().from_dict(event) for event in self.events],
         )
 
 
-@attr.s
+@attr.s(slots=True)
 class Attribute(JSONSerializable):
     key: str = attr.ib()
     value: str = attr.ib()
 
+    def to_data(self) -> dict:
+        return dict_to_data(attr.asdict(self))
+
     def to_proto(self) -> Attribute_pb:
-        proto = Attribute_pb()
-        proto.key = self.key
-        proto.value = self.value
-        return proto
+        return Attribute_pb(key=self.key, value=self.value)
 
     @classmethod
     def from_proto(cls, attrib: Attribute_pb) -> Attribute:
-        return cls(key=attrib["key"], value=attrib["value"])
+        return cls(key=attrib.key, value=attrib.value)
 
 
-@attr.s
+@attr.s(slots=True)
 class StringEvent(JSONSerializable):
 
     type: str = attr.ib()
     attributes = attr.ib()
 
+    def to_data(self) -> dict:
+        return dict_to_data(attr.asdict(self))
+
     def to_proto(self) -> StringEvent_pb:
         return StringEvent_pb(type=self.type, attributes=self.attributes)
 
     @classmethod
     def from_proto(cls, str_event: StringEvent_pb) -> StringEvent:
-        return cls(type=str_event["type"], attributes=str_event["attributes"])
+        return cls(type=str_event.type, attributes=str_event.attributes)
 
 
 def parse_tx_logs(logs) -> Optional[List[TxLog]]:
-    return (
-        [
-            TxLog(msg_index=i, log=log.get("log"), events=log.get("events"))
-            for i, log in enumerate(logs)
-        ]
-        if logs
-        else None
-    )
+    if not logs:
+        return None
+    return [
+        TxLog(msg_index=i, log=log.get("log"), events=log.get("events"))
+        for i, log in enumerate(logs)
+    ]
 
 
 def parse_tx_logs_proto(logs: List[AbciMessageLog_pb]) -> Optional[List[TxLog]]:
-    return [TxLog.from_proto(log) for log in logs] if logs else None
+    if not logs:
+        return None
+    return [TxLog.from_proto(log) for log in logs]
 
 
-@attr.s
+@attr.s(slots=True)
 class TxInfo(JSONSerializable):
     """Holds information pertaining to a transaction which has been included in a block
     on the blockchain.
@@ -394,7 +397,7 @@ class TxInfo(JSONSerializable):
         :meth:`TxAPI.tx_info()<terra_sdk.client.lcd.api.tx.TxAPI.tx_info>`
     """
 
-    height: int = attr.ib(converter=int)
+    height: int = attr.ib()
     """Block height at which transaction was included."""
 
     txhash: str = attr.ib()
@@ -406,10 +409,10 @@ class TxInfo(JSONSerializable):
     logs: Optional[List[TxLog]] = attr.ib()
     """Event log information."""
 
-    gas_wanted: int = attr.ib(converter=int)
+    gas_wanted: int = attr.ib()
     """Gas requested by transaction."""
 
-    gas_used: int = attr.ib(converter=int)
+    gas_used: int = attr.ib()
     """Actual gas amount used."""
 
     tx: Tx = attr.ib()
@@ -443,12 +446,12 @@ class TxInfo(JSONSerializable):
     @classmethod
     def from_data(cls, data: dict) -> TxInfo:
         return cls(
-            data.get("height"),
+            int(data.get("height")),
             data.get("txhash"),
             data.get("raw_log"),
             parse_tx_logs(data.get("logs")),
-            data.get("gas_wanted"),
-            data.get("gas_used"),
+            int(data.get("gas_wanted")),
+            int(data.get("gas_used")),
             Tx.from_data(data.get("tx")),
             data.get("timestamp"),
             data.get("code"),
@@ -456,18 +459,18 @@ class TxInfo(JSONSerializable):
         )
 
     def to_proto(self) -> TxResponse_pb:
-        proto = TxResponse_pb()
-        proto.height = self.height
-        proto.txhash = self.txhash
-        proto.raw_log = self.rawlog
-        proto.logs = [log.to_proto() for log in self.logs] if self.logs else None
-        proto.gas_wanted = self.gas_wanted
-        proto.gas_used = self.gas_used
-        proto.timestamp = self.timestamp
-        proto.tx = self.tx.to_proto()
-        proto.code = self.code
-        proto.codespace = self.codespace
-        return proto
+        return TxResponse_pb(
+            height=self.height,
+            txhash=self.txhash,
+            raw_log=self.rawlog,
+            logs=[log.to_proto() for log in self.logs] if self.logs else None,
+            gas_wanted=self.gas_wanted,
+            gas_used=self.gas_used,
+            timestamp=self.timestamp,
+            tx=self.tx.to_proto(),
+            code=self.code,
+            codespace=self.codespace,
+        )
 
     @classmethod
     def from_proto(cls, proto: TxResponse_pb) -> TxInfo:
@@ -46,11 +46,11 @@ def create_demux_proto(inputs: List) -> Callable[[Dict[str, Any]], Any]:
 
 # Any_pb to Proto for msgs
 def create_demux_unpack_any(inputs: List) -> Callable[[Dict[str, Any]], Any]:
-    table = {i.type_url: i.from_proto for i in inputs}
-    prototypes = {i.type_url: i.prototype for i in inputs}
+    table = {i.type_url: (i.from_proto, i.prototype) for i in inputs}
 
     def unpack_any(proto: Any_pb):
-        return table[proto.type_url](prototypes[proto.type_url]().parse(proto.value))
+        from_proto, prototype = table[proto.type_url]
+        return from_proto(prototype().parse(proto.value))
 
     return unpack_any
 
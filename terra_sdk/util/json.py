@@ -48,6 +48,8 @@ def dict_to_data(d: dict) -> dict:
 
 
 class JSONSerializable(ABC):
+    __slots__ = ()
+
     def to_data(self) -> Any:
         """Converts the object to its JSON-serializable Python data representation."""
         return dict_to_data(copy.deepcopy(self.__dict__))
@@ -0,0 +1,25 @@
+from terra_sdk.core.compact_bit_array import CompactBitArray
+
+
+def test_num_true_bits_before():
+    bits = CompactBitArray.from_bits(16)
+    for i in (0, 3, 8, 15):
+        bits.set_index(i, True)
+
+    assert bits.num_true_bits_before(0) == 0
+    assert bits.num_true_bits_before(4) == 2
+    assert bits.num_true_bits_before(9) == 3
+    assert bits.num_true_bits_before(15) == 3
+    assert bits.num_true_bits_before(16) == 4
+    assert bits.num_true_bits_before(100) == 4
+
+
+def test_from_bits_partial_byte():
+    bits = CompactBitArray.from_bits(10)
+
+    assert bits.count() == 10
+    assert len(bits.elems) == 2
+    assert bits.set_index(9, True)
+    assert not bits.set_index(10, True)
+    assert bits.get_index(9)
+    assert bits.num_true_bits_before(10) == 1
@@ -0,0 +1,76 @@
+from terra_sdk.core.compact_bit_array import CompactBitArray
+from terra_sdk.core.mode_info import (
+    ModeInfo,
+    ModeInfoMulti,
+    ModeInfoMulti_pb,
+    ModeInfoSingle,
+)
+from terra_sdk.core.tx import (
+    AbciMessageLog_pb,
+    Attribute,
+    Attribute_pb,
+    SignMode,
+    StringEvent,
+    StringEvent_pb,
+    Tx,
+    TxLog,
+)
+
+
+def test_attribute_proto_round_trip():
+    attrib = Attribute("sender", "terra1mzhc9gvfyh9swxed7eaxn2d6zzc3msgftk4w9e")
+    proto = Attribute_pb().parse(bytes(attrib.to_proto()))
+    assert Attribute.from_proto(proto) == attrib
+
+
+def test_string_event_proto_round_trip():
+    proto = StringEvent_pb(
+        type="transfer", attributes=[Attribute_pb(key="amount", value="1000uluna")]
+    )
+    parsed = StringEvent_pb().parse(bytes(StringEvent.from_proto(proto).to_proto()))
+    assert parsed == proto
+
+
+def test_mode_info_multi_from_proto():
+    multi = ModeInfoMulti(
+        CompactBitArray.from_bits(3),
+        [ModeInfo(single=ModeInfoSingle(mode=SignMode.SIGN_MODE_DIRECT))],
+    )
+    proto = ModeInfoMulti_pb().parse(bytes(multi.to_proto()))
+    assert ModeInfoMulti.from_proto(proto) == multi
+
+
+def test_tx_log_proto_round_trip():
+    log = TxLog(
+        msg_index=0,
+        log="",
+        events=[
+            {
+                "type": "transfer",
+                "attributes": [
+                    {
+                        "key": "recipient",
+                        "value": "terra1mzhc9gvfyh9swxed7eaxn2d6zzc3msgftk4w9e",
+                    },
+                    {"key": "amount", "value": ""},
+                ],
+            }
+        ],
+    )
+    parsed = TxLog.from_proto(AbciMessageLog_pb().parse(bytes(log.to_proto())))
+    assert parsed.events == log.events
+    assert parsed.events_by_type == log.events_by_type
+
+
+def test_multisig_mode_info_tx_round_trip(load_json_examples):
+    tx = Tx.from_data(load_json_examples("./Tx.data.json")["tx"])
+    signer = tx.auth_info.signer_infos[0]
+    signer.mode_info = ModeInfo(
+        multi=ModeInfoMulti(
+            CompactBitArray.from_bits(3),
+            [ModeInfo(single=ModeInfoSingle(mode=SignMode.SIGN_MODE_DIRECT))],
+        )
+    )
+
+    parsed = Tx.from_bytes(bytes(tx.to_proto()))
+    assert parsed.auth_info.signer_infos[0].mode_info == signer.mode_info